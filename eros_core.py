@@ -11,24 +11,88 @@ This implements a hierarchical swarm architecture with:
 import asyncio
 import json
 import time
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Optional, Any
-from enum import Enum
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import List, Dict, Optional, Any, Callable, Sequence, Tuple, Mapping
+from enum import IntEnum
 import re
-from collections import deque
+import sys
+from array import array
+from bisect import bisect_right
+from collections import ChainMap, deque
 
 
-class AgentState(Enum):
-    """Agent execution states"""
-    IDLE = "idle"
-    RUNNING = "running"
-    STALLED = "stalled"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    KILLED = "killed"
+# PAD signal vocabularies, compiled once at import so each monitor tick
+# is a single regex scan per category instead of one substring scan per signal
+ERROR_SIGNALS = frozenset(["error", "failed", "retry", "trying again", "unable"])
+UNCERTAIN_SIGNALS = frozenset(["maybe", "might", "uncertain", "not sure", "trying"])
+CONFIDENT_SIGNALS = frozenset(["completed", "success", "done", "processed"])
 
 
-@dataclass
+def _compile_signals(signals: frozenset) -> "re.Pattern":
+    # A zero-width lookahead is tried at every position, so overlapping
+    # signals ("retrying again" holds "retry" and "trying again") are all
+    # found, exactly like the substring checks this replaces. Longest first;
+    # shorter signals that prefix the match at the same position are implied
+    ordered = sorted(signals, key=len, reverse=True)
+    return re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))")
+
+
+def _prefix_closure(signals: frozenset) -> Dict[str, frozenset]:
+    """Each signal mapped to every signal it starts with (itself included)"""
+    return {s: frozenset(t for t in signals if s.startswith(t)) for s in signals}
+
+
+_ERROR_RE = _compile_signals(ERROR_SIGNALS)
+_UNCERTAIN_RE = _compile_signals(UNCERTAIN_SIGNALS)
+_CONFIDENT_RE = _compile_signals(CONFIDENT_SIGNALS)
+
+_SIGNAL_PREFIXES: Dict["re.Pattern", Dict[str, frozenset]] = {
+    _ERROR_RE: _prefix_closure(ERROR_SIGNALS),
+    _UNCERTAIN_RE: _prefix_closure(UNCERTAIN_SIGNALS),
+    _CONFIDENT_RE: _prefix_closure(CONFIDENT_SIGNALS),
+}
+
+
+def _count_signals(pattern: "re.Pattern", text: str) -> int:
+    """Number of distinct signals present in text"""
+    prefixes = _SIGNAL_PREFIXES[pattern]
+    found = set()
+    for match in pattern.finditer(text):
+        found |= prefixes[match.group(1)]
+    return len(found)
+
+
+def goal_keywords_for(task_goal: str) -> frozenset:
+    """Keyword set used for PAD goal alignment"""
+    return frozenset(task_goal.lower().split())
+
+
+def diagnosis_table(low_pleasure: str,
+                    high_arousal: str,
+                    low_dominance: str,
+                    unknown: str = "Unknown failure mode") -> Dict[Tuple[bool, bool, bool], str]:
+    """
+    Failure diagnosis for every (low pleasure, high arousal, low dominance)
+    combination, keeping pleasure > arousal > dominance precedence
+    """
+    return {
+        (p, a, d): low_pleasure if p else high_arousal if a else low_dominance if d else unknown
+        for p in (False, True) for a in (False, True) for d in (False, True)
+    }
+
+
+class AgentState(IntEnum):
+    """Agent execution states (compact integer ids, usable as list indexes)"""
+    IDLE = 0
+    RUNNING = 1
+    STALLED = 2
+    COMPLETED = 3
+    FAILED = 4
+    KILLED = 5
+
+
+@dataclass(slots=True)
 class PADTelemetry:
     """
     PAD (Pleasure-Arousal-Dominance) Telemetry
@@ -40,12 +104,21 @@ class PADTelemetry:
     
     def is_healthy(self) -> bool:
         """Check if agent is operating within healthy parameters"""
+        return PADTelemetry.row_is_healthy(self.pleasure, self.arousal, self.dominance)
+    
+    @staticmethod
+    def row_is_healthy(pleasure: float, arousal: float, dominance: float) -> bool:
+        """Health check on raw P/A/D values (used for cached PAD rows)"""
         return (
-            self.pleasure > 0.2 and  # Making progress
-            self.arousal < 0.8 and   # Not stalling/looping
-            self.dominance > 0.3     # Has reasonable certainty
+            pleasure > 0.2 and  # Making progress
+            arousal < 0.8 and   # Not stalling/looping
+            dominance > 0.3     # Has reasonable certainty
         )
     
+    def to_dict(self) -> Dict[str, float]:
+        """Plain dict view (cheaper than dataclasses.asdict)"""
+        return {"pleasure": self.pleasure, "arousal": self.arousal, "dominance": self.dominance}
+    
     def __str__(self):
         return f"PAD(P={self.pleasure:.2f}, A={self.arousal:.2f}, D={self.dominance:.2f})"
 
@@ -59,24 +132,54 @@ class BeliefRegistry:
     - asyncio.Lock() for state mutations
     - OR distributed store (Redis) with atomic operations
     - Current implementation is single-threaded safe only
+    
+    Turn/state and agent_registry are guarded by separate locks; sync()
+    reads a copy-on-write snapshot and never takes a lock.
     """
     
+    __slots__ = (
+        "project_id", "_global_constraints", "state", "turn_number",
+        "agent_registry", "version", "_lock", "_registry_lock",
+        "_constraints_view", "_snapshot", "_dict_cache", "_dict_cache_version"
+    )
+    
     def __init__(self, project_id: str, global_constraints: Dict[str, Any]):
-        self.project_id = project_id
-        self.global_constraints = global_constraints
+        self.project_id = sys.intern(project_id)
+        # Private copy behind one read-only view shared by every snapshot: the
+        # constraints can't change after construction, so consumers can cache
+        # anything derived from them by identity across turns
+        self._global_constraints = dict(global_constraints or {})  # None means no constraints
+        self._constraints_view = MappingProxyType(self._global_constraints)
         self.state = "initialization"
         self.turn_number = 0
         self.agent_registry: Dict[str, Dict] = {}
-        self._lock = asyncio.Lock()  # CRITICAL: Prevent race conditions
+        self._lock = asyncio.Lock()  # CRITICAL: Prevent race conditions on turn/state
+        self._registry_lock = asyncio.Lock()  # agent_registry writes only
+        self.version = 0  # Bumped by every mutation; lets readers reuse derived views
+        self._snapshot = self._build_snapshot()
+        self._dict_cache: Optional[Mapping[str, Any]] = None
+        self._dict_cache_version = -1
         
-    def sync(self) -> Dict[str, Any]:
-        """Agents sync with registry before every turn"""
-        return {
+    @property
+    def global_constraints(self) -> Mapping[str, Any]:
+        """Project DNA, read-only for the lifetime of the registry"""
+        return self._constraints_view
+    
+    def _build_snapshot(self) -> Mapping[str, Any]:
+        """Immutable view of the current turn, republished on every transition"""
+        return MappingProxyType({
             "project_id": self.project_id,
-            "global_constraints": self.global_constraints,
+            "global_constraints": self._constraints_view,
             "state": self.state,
             "turn": self.turn_number
-        }
+        })
+        
+    def sync(self) -> Mapping[str, Any]:
+        """
+        Agents sync with registry before every turn
+        LOCK-FREE: returns the last published snapshot (a single reference read)
+        """
+        return self._snapshot
     
     async def advance_turn(self, new_state: str):
         """
@@ -85,28 +188,141 @@ class BeliefRegistry:
         """
         async with self._lock:
             self.turn_number += 1
-            self.state = new_state
+            self.state = sys.intern(new_state)
+            self.version += 1
+            self._snapshot = self._build_snapshot()
         
     async def register_agent(self, agent_id: str, metadata: Dict):
         """
         Register an agent in the shared registry
         THREAD-SAFE: Uses lock to prevent concurrent modification
         """
-        async with self._lock:
-            self.agent_registry[agent_id] = {
-                **metadata,
-                "registered_at": time.time(),
-                "turn": self.turn_number
-            }
+        await self.register_agents([(agent_id, metadata)])
     
-    def to_dict(self) -> Dict:
-        return {
-            "project_id": self.project_id,
-            "constraints": self.global_constraints,
-            "state": self.state,
-            "turn": self.turn_number,
-            "agents": len(self.agent_registry)
-        }
+    async def register_agents(self, items: List[Tuple[str, Dict]]):
+        """
+        Register a batch of agents in the shared registry
+        THREAD-SAFE: One lock acquisition and one timestamp per batch
+        """
+        registered_at = time.time()
+        async with self._registry_lock:
+            turn = self.turn_number
+            self.agent_registry.update({
+                agent_id: {**metadata, "registered_at": registered_at, "turn": turn}
+                for agent_id, metadata in items
+            })
+            self.version += 1
+    
+    def to_dict(self) -> Mapping[str, Any]:
+        """
+        Summary view, rebuilt only when the registry version changes
+        Read-only (shared between callers); copy with dict() to modify or serialize
+        """
+        if self._dict_cache_version != self.version:
+            self._dict_cache = MappingProxyType({
+                "project_id": self.project_id,
+                "constraints": self._constraints_view,
+                "state": self.state,
+                "turn": self.turn_number,
+                "agents": len(self.agent_registry)
+            })
+            self._dict_cache_version = self.version
+        return self._dict_cache
+
+
+class RingBuffer:
+    """
+    Fixed-capacity output history stored as parallel columns
+    (timestamps, contents, steps, terminal flags) instead of one dict per
+    entry; dict views are only materialized when read
+    """
+    
+    def __init__(self, capacity: int = 100):
+        self.capacity = capacity
+        self._timestamps = array('d', [0.0]) * capacity
+        self._contents: List[str] = [""] * capacity
+        self._steps = array('i', [0]) * capacity
+        self._terminal = array('B', [0]) * capacity
+        self._head = 0  # Next slot to write
+        self._size = 0
+    
+    def append(self, content: str, step: int = 0, terminal: bool = False):
+        head = self._head
+        self._timestamps[head] = time.time()
+        self._contents[head] = content
+        self._steps[head] = step
+        self._terminal[head] = terminal
+        self._head = (head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def _entry(self, slot: int) -> Dict:
+        entry = {"timestamp": self._timestamps[slot], "content": self._contents[slot]}
+        if self._terminal[slot]:
+            entry["terminal"] = True
+        else:
+            entry["step"] = self._steps[slot]
+        return entry
+    
+    def __getitem__(self, index: int) -> Dict:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("RingBuffer index out of range")
+        return self._entry((self._head - self._size + index) % self.capacity)
+    
+    def __iter__(self):
+        return iter(self.recent(self._size))
+    
+    def recent(self, n: int) -> List[Dict]:
+        """n most recent entries, oldest first"""
+        n = max(0, min(n, self._size))
+        start = self._head - n
+        return [self._entry((start + i) % self.capacity) for i in range(n)]
+
+
+class SimClock:
+    """
+    Shared tick source for simulated work
+    One coroutine sleeps per tick and wakes every waiting intern, instead of
+    each intern scheduling its own timer for every step
+    """
+    
+    def __init__(self, dt: float = 0.1):
+        self.dt = dt
+        # Created inside the running loop; an Event binds to the first loop
+        # that waits on it, so they are rebuilt if a new loop shows up
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tick: Optional[asyncio.Event] = None
+        self._waiters = 0
+        self._runner: Optional[asyncio.Task] = None
+    
+    async def run(self):
+        """Tick every dt while anyone is waiting"""
+        while self._waiters:
+            await asyncio.sleep(self.dt)
+            self._tick.set()
+            self._tick.clear()
+    
+    async def wait(self):
+        """Wait for the next tick (starts the ticker on demand)"""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._tick = asyncio.Event()
+            self._waiters = 0
+            self._runner = None
+        
+        self._waiters += 1
+        if self._runner is None or self._runner.done():
+            self._runner = loop.create_task(self.run())
+        try:
+            await self._tick.wait()
+        finally:
+            self._waiters -= 1
 
 
 class InternAgent:
@@ -115,23 +331,82 @@ class InternAgent:
     Focused on single tool/task, operates in "instant mode"
     """
     
+    PAD_WINDOW = 5  # Outputs the manager samples for telemetry
+    OUTPUT_HISTORY = 100  # Bounded output history per intern
+    
+    __slots__ = (
+        "agent_id", "specialty", "manager_id", "_state", "_state_listener",
+        "output_buffer", "recent_texts", "recent_combined_lower",
+        "_pulse_queue", "_pulse_pending", "_first_output", "_first_output_loop",
+        "task", "pending_task", "goal_keywords", "clock", "start_time"
+    )
+    
     def __init__(self, agent_id: str, specialty: str, manager_id: str):
         self.agent_id = agent_id
         self.specialty = specialty  # e.g., "code", "browser", "search"
         self.manager_id = manager_id
-        self.state = AgentState.IDLE
-        self.output_buffer = deque(maxlen=100)  # Rolling window of recent outputs
-        self.task: Optional[Dict] = None
+        self._state = AgentState.IDLE
+        self._state_listener: Optional[Callable[["InternAgent", AgentState, AgentState], None]] = None
+        self.output_buffer = RingBuffer(self.OUTPUT_HISTORY)  # Rolling window of recent outputs
+        # Lower-cased PAD window, kept current on every emit so monitoring
+        # never re-joins or re-lowercases the buffer
+        self.recent_texts: deque = deque(maxlen=self.PAD_WINDOW)
+        self.recent_combined_lower = ""
+        # Manager's output-signal queue; set at spawn time
+        self._pulse_queue: Optional[asyncio.Queue] = None
+        self._pulse_pending = False  # Coalesce signals until the manager consumes one
+        # Set on the first output of each task; see first_output_event
+        self._first_output = asyncio.Event()
+        self._first_output_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.task: Optional[Mapping] = None
+        self.pending_task: Optional[Mapping] = None  # Corrected task awaiting launch
+        self.goal_keywords: frozenset = frozenset()  # Cached per task for PAD
+        self.clock: Optional[SimClock] = None  # Shared manager clock for simulated steps
         self.start_time: Optional[float] = None
+    
+    @property
+    def first_output_event(self) -> asyncio.Event:
+        """
+        Set on the first output of each task
+        An Event binds to the first loop that waits on it, so it is rebuilt
+        when the intern is used from a new loop (like SimClock)
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self._first_output
+        if loop is not self._first_output_loop:
+            was_set = self._first_output.is_set()
+            self._first_output_loop = loop
+            self._first_output = asyncio.Event()
+            if was_set:
+                self._first_output.set()
+        return self._first_output
+    
+    @property
+    def state(self) -> AgentState:
+        return self._state
+    
+    @state.setter
+    def state(self, new_state: AgentState):
+        """State transitions are reported to the owning manager's indexes"""
+        old_state = self._state
+        self._state = new_state
+        if self._state_listener is not None:
+            self._state_listener(self, old_state, new_state)
         
-    async def execute_task(self, task: Dict, belief_context: Dict) -> Dict:
+    async def execute_task(self, task: Mapping, belief_context: Mapping) -> Dict:
         """
         Execute assigned task with belief context
         Simulates actual agent work (replace with real Kimi API calls)
         """
         self.task = task
+        if task is self.pending_task:
+            self.pending_task = None
+        self.goal_keywords = goal_keywords_for(task.get("goal", ""))
+        self.first_output_event.clear()
         self.state = AgentState.RUNNING
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         
         # Simulate work with periodic output
         result = {
@@ -141,16 +416,19 @@ class InternAgent:
             "status": "in_progress"
         }
         
+        # Step text only varies by step number; render the rest once per task
+        step_suffix = f": Processing {self.specialty} for {task.get('goal', 'unknown')}"
+        
         # Simulate incremental work (in real impl, this would be streaming API response)
         for step in range(task.get("estimated_steps", 5)):
-            await asyncio.sleep(0.1)  # Simulate work
+            # Simulate work
+            if self.clock is not None:
+                await self.clock.wait()
+            else:
+                await asyncio.sleep(0.1)
             
-            output = f"Step {step + 1}: Processing {self.specialty} for {task.get('goal', 'unknown')}"
-            self.output_buffer.append({
-                "timestamp": time.time(),
-                "content": output,
-                "step": step + 1
-            })
+            output = f"Step {step + 1}{step_suffix}"
+            self._emit_output(output, step=step + 1)
             result["outputs"].append(output)
             
             # Simulate potential failure modes
@@ -161,22 +439,31 @@ class InternAgent:
                 return result
         
         result["status"] = "completed"
-        result["duration"] = time.time() - self.start_time
+        result["duration"] = time.monotonic() - self.start_time
         self.state = AgentState.COMPLETED
         return result
     
+    def _emit_output(self, content: str, step: int = 0, terminal: bool = False):
+        """Append to the output buffer and roll the PAD text window"""
+        self.output_buffer.append(content, step, terminal)
+        self.recent_texts.append(content.lower())
+        self.recent_combined_lower = " ".join(self.recent_texts)
+        if not self.first_output_event.is_set():
+            self.first_output_event.set()
+        
+        # Wake the manager's monitor instead of waiting for its next poll
+        if self._pulse_queue is not None and not self._pulse_pending:
+            self._pulse_pending = True
+            self._pulse_queue.put_nowait(self.agent_id)
+    
     def get_recent_output(self, n: int = 10) -> List[Dict]:
         """Get n most recent outputs for telemetry analysis"""
-        return list(self.output_buffer)[-n:]
+        return self.output_buffer.recent(n)
     
     def kill(self, reason: str):
         """Manager-issued SIG_KILL"""
         self.state = AgentState.KILLED
-        self.output_buffer.append({
-            "timestamp": time.time(),
-            "content": f"KILLED: {reason}",
-            "terminal": True
-        })
+        self._emit_output(f"KILLED: {reason}", terminal=True)
 
 
 class PADAnalyzer:
@@ -186,9 +473,12 @@ class PADAnalyzer:
     """
     
     @staticmethod
-    def analyze_output(outputs: List[Dict], task_goal: str) -> PADTelemetry:
+    def analyze_output(outputs: List[Dict],
+                       task_goal: str,
+                       goal_keywords: Optional[frozenset] = None) -> PADTelemetry:
         """
         Compute PAD vector from recent outputs
+        Pass precomputed goal_keywords to skip re-splitting the goal every tick
         """
         if not outputs:
             return PADTelemetry(pleasure=0.0, arousal=0.0, dominance=0.0)
@@ -197,32 +487,95 @@ class PADAnalyzer:
         texts = [o.get("content", "") for o in outputs]
         combined_text = " ".join(texts).lower()
         
+        if goal_keywords is None:
+            goal_keywords = goal_keywords_for(task_goal)
+        return PADAnalyzer.analyze_text(combined_text, texts, goal_keywords)
+    
+    @staticmethod
+    def analyze_text(combined_text: str,
+                     texts: Sequence[str],
+                     goal_keywords: frozenset) -> PADTelemetry:
+        """
+        Compute PAD vector from an already joined, lower-cased window
+        Hot path for monitoring: no per-tick join/lower work
+        """
+        if not texts:
+            return PADTelemetry(pleasure=0.0, arousal=0.0, dominance=0.0)
+        
+        return PADAnalyzer._score(
+            combined_text,
+            texts,
+            goal_keywords,
+            _count_signals(_ERROR_RE, combined_text),
+            _count_signals(_UNCERTAIN_RE, combined_text),
+            _count_signals(_CONFIDENT_RE, combined_text)
+        )
+    
+    @staticmethod
+    def analyze_batch(combined_texts: Sequence[str],
+                      windows: Sequence[Sequence[str]],
+                      goal_keywords: Sequence[frozenset]) -> List[PADTelemetry]:
+        """
+        Compute PAD vectors for many interns at once
+        Each signal pattern scans the concatenated windows exactly once;
+        matches are attributed back to their intern by offset
+        """
+        starts = []
+        offset = 0
+        for text in combined_texts:
+            starts.append(offset)
+            offset += len(text) + 1
+        buffer = "\x00".join(combined_texts)  # Separator no signal can span
+        
+        def per_stream_counts(pattern: "re.Pattern") -> List[int]:
+            prefixes = _SIGNAL_PREFIXES[pattern]
+            found = [set() for _ in combined_texts]
+            for match in pattern.finditer(buffer):
+                found[bisect_right(starts, match.start()) - 1] |= prefixes[match.group(1)]
+            return [len(signals) for signals in found]
+        
+        error_counts = per_stream_counts(_ERROR_RE)
+        uncertain_counts = per_stream_counts(_UNCERTAIN_RE)
+        confident_counts = per_stream_counts(_CONFIDENT_RE)
+        
+        results = []
+        for i, texts in enumerate(windows):
+            if not texts:
+                results.append(PADTelemetry(pleasure=0.0, arousal=0.0, dominance=0.0))
+                continue
+            results.append(PADAnalyzer._score(
+                combined_texts[i],
+                texts,
+                goal_keywords[i],
+                error_counts[i],
+                uncertain_counts[i],
+                confident_counts[i]
+            ))
+        return results
+    
+    @staticmethod
+    def _score(combined_text: str,
+               texts: Sequence[str],
+               goal_keywords: frozenset,
+               error_count: int,
+               uncertain_count: int,
+               confident_count: int) -> PADTelemetry:
+        """Combine goal overlap, repetition and signal counts into PAD"""
         # P (Pleasure): Goal alignment - simple keyword matching
-        goal_keywords = set(task_goal.lower().split())
-        output_keywords = set(combined_text.split())
-        overlap = len(goal_keywords & output_keywords)
+        overlap = len(goal_keywords.intersection(combined_text.split()))
         pleasure = min(1.0, overlap / max(len(goal_keywords), 1))
         
         # A (Arousal): Detect stalling - repetition and error patterns
-        error_signals = ["error", "failed", "retry", "trying again", "unable"]
-        error_count = sum(1 for signal in error_signals if signal in combined_text)
-        
         # Check for repetitive patterns (stalling indicator)
         repetition_score = 0.0
         if len(texts) >= 3:
-            recent = texts[-3:]
+            recent = list(texts)[-3:]
             if len(set(recent)) < len(recent):  # Duplicates detected
                 repetition_score = 0.4
         
         arousal = min(1.0, (error_count * 0.2) + repetition_score)
         
         # D (Dominance): Certainty - look for confident language
-        uncertain_signals = ["maybe", "might", "uncertain", "not sure", "trying"]
-        confident_signals = ["completed", "success", "done", "processed"]
-        
-        uncertain_count = sum(1 for signal in uncertain_signals if signal in combined_text)
-        confident_count = sum(1 for signal in confident_signals if signal in combined_text)
-        
         dominance = max(0.0, min(1.0, (confident_count - uncertain_count * 0.5) / 5))
         
         return PADTelemetry(
@@ -238,55 +591,316 @@ class EROSManager:
     Manages 4-10 intern agents with asynchronous sampling
     """
     
+    __slots__ = (
+        "manager_id", "belief_registry", "interns", "agent_map",
+        "max_interns", "monitoring_interval", "clock", "status_log",
+        "_counts", "_pad_rows", "_pulse_snapshot",
+        "registration_batch_size", "_reg_queue", "_reg_task", "_pulse_queue",
+        "_active_launches", "_loop"
+    )
+    
+    # Keyed by (pleasure < 0.2, arousal > 0.8, dominance < 0.3)
+    _DIAGNOSES = diagnosis_table(
+        "Low goal alignment - task divergence detected",
+        "High arousal - agent stalling or infinite retry loop",
+        "Low dominance - agent showing excessive uncertainty"
+    )
+    
     def __init__(self, manager_id: str, belief_registry: BeliefRegistry):
         self.manager_id = manager_id
         self.belief_registry = belief_registry
         self.interns: List[InternAgent] = []
+        self.agent_map: Dict[str, InternAgent] = {}  # O(1) lookup by agent_id
         self.max_interns = 10
         self.monitoring_interval = 0.5  # Check interns every 500ms
+        self.clock = SimClock(0.1)  # One timer for every intern's simulated steps
         self.status_log: List[Dict] = []
         
+        # Live state counters updated on every transition so pulses never rescan
+        self._counts: List[int] = [0] * len(AgentState)  # Indexed by AgentState
+        self._pad_rows: Dict[str, Tuple[float, float, float]] = {}  # Latest PAD per monitored intern
+        # Most recent status pulse, rebuilt on every change and swapped in with
+        # a single attribute rebind so readers never need a lock
+        self._pulse_snapshot: Dict = {}
+        self._publish_pulse()
+        
+        # Registry writes are queued and applied in batches by one drainer task
+        self.registration_batch_size = 32
+        self._reg_queue: asyncio.Queue = asyncio.Queue()
+        self._reg_task: Optional[asyncio.Task] = None
+        
+        # Interns signal here when they emit output (event-driven monitoring)
+        self._pulse_queue: asyncio.Queue = asyncio.Queue()
+        
+        # Loop the queues are used from; see _bind_loop
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # launch() calls still starting or running interns; monitor_loop keeps
+        # going while any are active, even between staggered starts
+        self._active_launches = 0
+        
     def spawn_intern(self, specialty: str) -> InternAgent:
         """Spawn a new intern agent"""
-        if len(self.interns) >= self.max_interns:
+        return self.spawn_interns_bulk([specialty])[0]
+    
+    def spawn_interns_bulk(self, specialties: Sequence[str]) -> List[InternAgent]:
+        """
+        Spawn several interns at once
+        Capacity is checked up front, the pulse is republished once and all
+        registrations land in the registry as a single batch
+        """
+        if len(self.interns) + len(specialties) > self.max_interns:
             raise ValueError(f"Manager {self.manager_id} at capacity")
         
-        agent_id = f"{self.manager_id}_intern_{len(self.interns)}"
-        intern = InternAgent(agent_id, specialty, self.manager_id)
-        self.interns.append(intern)
+        spawned = []
+        for specialty in specialties:
+            agent_id = f"{self.manager_id}_intern_{len(self.interns)}"
+            intern = InternAgent(agent_id, specialty, self.manager_id)
+            intern._state_listener = self._set_state
+            self._counts[intern.state] += 1
+            intern._pulse_queue = self._pulse_queue
+            intern.clock = self.clock
+            self.interns.append(intern)
+            self.agent_map[agent_id] = intern
+            spawned.append(intern)
+            
+            # Register in belief registry via the batched drainer (async safe)
+            self._reg_queue.put_nowait((agent_id, {
+                "type": "intern",
+                "specialty": specialty,
+                "manager": self.manager_id
+            }))
+        
+        self._publish_pulse()
+        self._ensure_registration_drainer()
+        return spawned
+    
+    def _bind_loop(self, loop: asyncio.AbstractEventLoop):
+        """
+        Move the manager's queues onto the running loop
+        A queue binds to the first loop that waits on it, so a manager reused
+        across asyncio.run() calls gets fresh queues holding the pending items
+        """
+        if loop is self._loop:
+            return
+        self._loop = loop
+        
+        def rebind(old: asyncio.Queue) -> asyncio.Queue:
+            new: asyncio.Queue = asyncio.Queue()
+            while not old.empty():
+                new.put_nowait(old.get_nowait())
+            return new
+        
+        self._reg_queue = rebind(self._reg_queue)
+        self._reg_task = None  # Any drainer belonged to the previous loop
+        self._pulse_queue = rebind(self._pulse_queue)
+        for intern in self.interns:
+            intern._pulse_queue = self._pulse_queue
+    
+    def _ensure_registration_drainer(self):
+        """Start the registration drainer once an event loop is running"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Queued entries are drained on the next spawn/flush in a loop
+        self._bind_loop(loop)
+        if self._reg_task is not None and not self._reg_task.done():
+            return
+        self._reg_task = loop.create_task(self._drain_registrations())
+    
+    async def _drain_registrations(self):
+        """
+        Apply queued registrations in batches
+        One lock acquisition per batch instead of one task + lock per intern
+        """
+        while True:
+            batch = [await self._reg_queue.get()]
+            while len(batch) < self.registration_batch_size:
+                try:
+                    batch.append(self._reg_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            
+            try:
+                await self.belief_registry.register_agents(batch)
+            finally:
+                for _ in batch:
+                    self._reg_queue.task_done()
+    
+    async def flush_registrations(self):
+        """Wait until every spawned intern is visible in the belief registry"""
+        self._ensure_registration_drainer()
+        await self._reg_queue.join()
+    
+    async def launch(self,
+                     pairs: Sequence[Tuple[InternAgent, Optional[Mapping]]],
+                     *,
+                     max_concurrency: int = 8,
+                     stagger: float = 0.05) -> List[Dict]:
+        """
+        Execute (intern, task) pairs with bounded concurrency
+        Starts are staggered so a large team doesn't all fire at t=0
+        Returns results in the order of pairs
+        A task of None runs the intern's pending_task (see respawn_with_correction)
+        If any pair raises, no further pairs start, the running ones are
+        cancelled and the first error is re-raised
+        """
+        # Resolve every task before starting any, so a bad pair fails cleanly
+        resolved = []
+        for intern, task in pairs:
+            if task is None:
+                task = intern.pending_task
+                if task is None:
+                    raise ValueError(f"Intern {intern.agent_id} has no task and no pending_task")
+            resolved.append((intern, task))
+        
+        belief_context = self.belief_registry.sync()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        running: List[asyncio.Task] = []
         
-        # Register in belief registry (async safe)
-        # Note: In production, wrap this in asyncio.create_task() or await it
-        asyncio.create_task(self.belief_registry.register_agent(agent_id, {
-            "type": "intern",
-            "specialty": specialty,
-            "manager": self.manager_id
-        }))
+        self._active_launches += 1
+        try:
+            # The task group owns every started intern: a failure cancels the
+            # dispatch loop and its siblings instead of leaving them orphaned
+            async with asyncio.TaskGroup() as group:
+                for index, (intern, task) in enumerate(resolved):
+                    if index and stagger:
+                        await asyncio.sleep(stagger)
+                    await semaphore.acquire()
+                    job = group.create_task(intern.execute_task(task, belief_context))
+                    job.add_done_callback(lambda _: semaphore.release())
+                    running.append(job)
+        except ExceptionGroup as errors:
+            # Interns that raised or were cancelled would otherwise stay RUNNING
+            for job, (intern, _) in zip(running, resolved):
+                if intern.state != AgentState.RUNNING:
+                    continue
+                if job.cancelled():
+                    intern.kill("launch aborted")
+                else:
+                    intern.state = AgentState.FAILED
+            raise errors.exceptions[0] from None  # Surface the original error, as gather did
+        finally:
+            self._active_launches -= 1
         
+        return [job.result() for job in running]
+    
+    async def next_output_signal(self, timeout: Optional[float] = None) -> Optional[InternAgent]:
+        """
+        Wait for an intern to emit output
+        Returns None after monitoring_interval so silent interns still get checked
+        """
+        if timeout is None:
+            timeout = self.monitoring_interval
+        self._bind_loop(asyncio.get_running_loop())
+        try:
+            agent_id = await asyncio.wait_for(self._pulse_queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        
+        intern = self.agent_map[agent_id]
+        intern._pulse_pending = False
         return intern
     
-    async def monitor_intern(self, intern: InternAgent) -> Optional[Dict]:
+    async def monitor_loop(self) -> List[Dict]:
+        """
+        Event-driven monitoring for this manager's team
+        Interns that signalled new output are scored as they signal; every
+        monitoring_interval all interns are swept so silent (stalled) ones are
+        still checked even while teammates keep emitting.
+        Intervenes on alerts; returns the intervention logs once no intern is
+        running and no launch() still has pairs waiting to start
+        """
+        interventions = []
+        last_sweep = time.monotonic()
+        while True:
+            signalled = await self.next_output_signal()
+            now = time.monotonic()
+            if signalled is None or now - last_sweep >= self.monitoring_interval:
+                candidates = list(self.interns)
+                last_sweep = now
+            else:
+                candidates = [signalled]
+            alerts = await self.monitor_all(candidates)
+            
+            for intern, alert in zip(candidates, alerts):
+                if alert:
+                    interventions.append(await self.intervene(intern, alert["reason"]))
+            
+            if not self._counts[AgentState.RUNNING] and not self._active_launches:
+                return interventions
+    
+    def get_intern(self, agent_id: str) -> Optional[InternAgent]:
+        """Look up an intern by id"""
+        return self.agent_map.get(agent_id)
+    
+    def _set_state(self, intern: InternAgent, old_state: AgentState, new_state: AgentState):
+        """Adjust live counters on an intern state transition"""
+        self._counts[old_state] -= 1
+        self._counts[new_state] += 1
+        if old_state == AgentState.RUNNING and new_state != AgentState.RUNNING:
+            self._pad_rows.pop(intern.agent_id, None)  # PAD matrix covers live interns only
+        self._publish_pulse()
+    
+    async def monitor_intern(self,
+                             intern: InternAgent,
+                             now: Optional[float] = None) -> Optional[Dict]:
         """
         Asynchronous sampling: peek at intern logs to verify alignment
         Returns status pulse if intervention needed
+        Pass now (time.monotonic()) to share one clock read across a monitor pass;
+        it only drives the warm-up/timeout checks - alert timestamps are time.time()
         """
-        if intern.state not in [AgentState.RUNNING]:
-            return None
-        
-        # CRITICAL FIX: Allow 30-second warm-up period to avoid cold-start false positives
-        if intern.start_time and time.time() - intern.start_time < 30:
-            return None  # Skip monitoring during initialization
-        
-        # Get recent output
-        recent_outputs = intern.get_recent_output(n=5)
-        if not recent_outputs or not intern.task:
+        if now is None:
+            now = time.monotonic()
+        if not self._due_for_analysis(intern, now):
             return None
         
         # Compute PAD telemetry
-        pad = PADAnalyzer.analyze_output(
-            recent_outputs,
-            intern.task.get("goal", "")
+        pad = PADAnalyzer.analyze_text(
+            intern.recent_combined_lower,
+            intern.recent_texts,
+            intern.goal_keywords
+        )
+        return self._evaluate_pad(intern, pad)
+    
+    async def monitor_all(self, interns: Optional[Sequence[InternAgent]] = None) -> List[Optional[Dict]]:
+        """
+        Monitor many interns in one pass
+        One clock read and one batched PAD scan for every eligible intern;
+        results line up with interns (None where no intervention is needed)
+        """
+        if interns is None:
+            interns = self.interns
+        now = time.monotonic()
+        
+        due = [intern for intern in interns if self._due_for_analysis(intern, now)]
+        pads = PADAnalyzer.analyze_batch(
+            [intern.recent_combined_lower for intern in due],
+            [intern.recent_texts for intern in due],
+            [intern.goal_keywords for intern in due]
         )
+        alerts = {
+            intern.agent_id: self._evaluate_pad(intern, pad)
+            for intern, pad in zip(due, pads)
+        }
+        return [alerts.get(intern.agent_id) for intern in interns]
+    
+    def _due_for_analysis(self, intern: InternAgent, now: float) -> bool:
+        """Whether an intern should be scored on this monitor pass"""
+        if intern.state not in [AgentState.RUNNING]:
+            return False
+        
+        # CRITICAL FIX: Allow 30-second warm-up period to avoid cold-start false positives
+        if intern.start_time and now - intern.start_time < 30:
+            return False  # Skip monitoring during initialization
+        
+        # Recent output window is maintained incrementally by the intern
+        return bool(intern.recent_texts) and bool(intern.task)
+    
+    def _evaluate_pad(self, intern: InternAgent, pad: PADTelemetry) -> Optional[Dict]:
+        """Record PAD for an intern and build an alert if it is unhealthy"""
+        self._pad_rows[intern.agent_id] = (pad.pleasure, pad.arousal, pad.dominance)
         
         # Check health
         if not pad.is_healthy():
@@ -295,22 +909,23 @@ class EROSManager:
                 "manager_id": self.manager_id,
                 "intern_id": intern.agent_id,
                 "alert": "INTERVENTION_REQUIRED",
-                "telemetry": asdict(pad),
+                "telemetry": pad.to_dict(),
                 "reason": self._diagnose_failure(pad),
-                "timestamp": time.time()
+                "timestamp": time.time()  # Wall clock, like status_log entries
             }
         
         return None
     
+    def pad_matrix(self) -> List[Tuple[float, float, float]]:
+        """
+        Latest (P, A, D) row per monitored running intern, kept warm by
+        monitor_intern and dropped when the intern stops running
+        """
+        return list(self._pad_rows.values())
+    
     def _diagnose_failure(self, pad: PADTelemetry) -> str:
         """Diagnose failure mode from PAD telemetry"""
-        if pad.pleasure < 0.2:
-            return "Low goal alignment - task divergence detected"
-        if pad.arousal > 0.8:
-            return "High arousal - agent stalling or infinite retry loop"
-        if pad.dominance < 0.3:
-            return "Low dominance - agent showing excessive uncertainty"
-        return "Unknown failure mode"
+        return self._DIAGNOSES[(pad.pleasure < 0.2, pad.arousal > 0.8, pad.dominance < 0.3)]
     
     async def intervene(self, intern: InternAgent, reason: str) -> Dict:
         """
@@ -328,6 +943,7 @@ class EROSManager:
             "task_id": intern.task.get("id") if intern.task else None
         }
         self.status_log.append(intervention_log)
+        self._publish_pulse()
         
         return intervention_log
     
@@ -336,15 +952,20 @@ class EROSManager:
                                      correction: str) -> InternAgent:
         """
         Respawn intern with corrected context
+        The corrected task is left on new_intern.pending_task for the next launch
         """
         # Create new intern with same specialty
         new_intern = self.spawn_intern(failed_intern.specialty)
         
-        # Prepare corrected task
+        # Overlay the correction on the failed task instead of copying it
         if failed_intern.task:
-            corrected_task = failed_intern.task.copy()
-            corrected_task["context_correction"] = correction
-            corrected_task["previous_attempt"] = failed_intern.agent_id
+            new_intern.pending_task = ChainMap(
+                {
+                    "context_correction": correction,
+                    "previous_attempt": failed_intern.agent_id
+                },
+                failed_intern.task
+            )
             
         return new_intern
     
@@ -352,12 +973,18 @@ class EROSManager:
         """
         Generate high-level status pulse for Sovereign Orchestrator
         Contains NO raw logs, only strategic summary
+        Returns the snapshot published at the last state change
         """
-        active_interns = sum(1 for i in self.interns if i.state == AgentState.RUNNING)
-        completed_interns = sum(1 for i in self.interns if i.state == AgentState.COMPLETED)
-        failed_interns = sum(1 for i in self.interns if i.state in [AgentState.FAILED, AgentState.KILLED])
+        return self._pulse_snapshot
+    
+    def _publish_pulse(self):
+        """Rebuild the status pulse snapshot from live counters"""
+        counts = self._counts
+        active_interns = counts[AgentState.RUNNING]
+        completed_interns = counts[AgentState.COMPLETED]
+        failed_interns = counts[AgentState.FAILED] + counts[AgentState.KILLED]
         
-        return {
+        self._pulse_snapshot = {
             "manager_id": self.manager_id,
             "timestamp": time.time(),
             "interns_total": len(self.interns),
@@ -388,16 +1015,12 @@ class SovereignOrchestrator:
         self.managers.append(manager)
         return manager
     
-    async def receive_status_pulses(self) -> List[Dict]:
+    def receive_status_pulses(self) -> List[Dict]:
         """
         Receive ONLY high-level status pulses from managers
         No raw agent logs allowed
         """
-        pulses = []
-        for manager in self.managers:
-            pulse = manager.get_status_pulse()
-            pulses.append(pulse)
-        return pulses
+        return [manager.get_status_pulse() for manager in self.managers]
     
     def make_strategic_decision(self, pulses: List[Dict]) -> Dict:
         """
@@ -442,6 +1065,26 @@ class SovereignOrchestrator:
         self.strategic_log.append(decision)
         return decision
     
+    def swarm_health(self) -> Dict:
+        """
+        Swarm-wide health from the managers' cached PAD rows
+        Aggregates only - no raw agent logs
+        """
+        rows = [row for manager in self.managers for row in manager.pad_matrix()]
+        healthy = sum(1 for row in rows if PADTelemetry.row_is_healthy(*row))
+        count = len(rows)
+        
+        return {
+            "sampled": count,
+            "healthy": healthy,
+            "unhealthy": count - healthy,
+            "mean_pad": {
+                "pleasure": sum(r[0] for r in rows) / count if count else 0.0,
+                "arousal": sum(r[1] for r in rows) / count if count else 0.0,
+                "dominance": sum(r[2] for r in rows) / count if count else 0.0
+            }
+        }
+    
     def get_orchestrator_view(self) -> Dict:
         """
         CEO's view: strategic overview only, no execution details
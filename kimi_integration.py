@@ -7,13 +7,60 @@ This replaces the simulated InternAgent.execute_task() with real API calls
 
 import asyncio
 import aiohttp
+import hashlib
+import io
 import json
-from typing import Dict, List, Optional, AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from itertools import islice
+from typing import Dict, List, Optional, AsyncIterator, Awaitable, Callable, Mapping, Sequence, Tuple
 from dataclasses import dataclass
 import time
 
+from eros_core import PADAnalyzer, PADTelemetry, diagnosis_table, goal_keywords_for
 
-@dataclass
+try:  # Optional: faster JSON on the streaming and prompt paths
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    _json_loads = orjson.loads
+    
+    def _json_bytes(obj) -> bytes:
+        return orjson.dumps(obj)
+    
+    def _json_pretty(obj) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
+        except TypeError:  # Types orjson rejects (e.g. huge ints) - let json decide
+            return json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=False)
+else:
+    _json_loads = json.loads
+    
+    def _json_bytes(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+    
+    def _json_pretty(obj) -> str:
+        return json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=False)
+
+
+def _str_keys(obj):
+    """Stringify mapping keys at every level so sorted output never compares mixed key types"""
+    if isinstance(obj, Mapping):
+        return {str(key): _str_keys(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_str_keys(item) for item in obj]
+    return obj
+
+
+def _constraints_block(constraints: Optional[Mapping]) -> str:
+    """Serialize global constraints for the system prompt (None counts as empty)"""
+    return _json_pretty(_str_keys(constraints or {}))
+
+
+@dataclass(frozen=True, slots=True)
 class KimiConfig:
     """Configuration for Kimi K2.5 API"""
     api_key: str
@@ -22,43 +69,116 @@ class KimiConfig:
     temperature: float = 0.7
     max_tokens: int = 4096
     timeout: int = 300  # 5 minutes
+    connection_pool_size: int = 32  # Keepalive connections to the API host
+    
+    def session_headers(self) -> Dict[str, str]:
+        """Headers for every Kimi API request"""
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+    
+    def new_session(self) -> aiohttp.ClientSession:
+        """
+        Session tuned for a single API host: all traffic goes to one host,
+        so the per-host limit is the real cap; DNS answers are cached
+        """
+        return aiohttp.ClientSession(
+            headers=self.session_headers(),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            connector=aiohttp.TCPConnector(
+                limit=0,
+                limit_per_host=self.connection_pool_size,
+                keepalive_timeout=75,
+                ttl_dns_cache=300
+            )
+        )
     
 
+def render_system_prompt(specialty: str,
+                         belief_context: Mapping,
+                         constraints_json: Optional[str] = None) -> str:
+    """
+    Render the system prompt for a specialty from a belief context
+    
+    Laid out for server-side KV prefix caching: everything that is stable
+    across turns comes first (constraints with sorted keys, so the bytes
+    are identical on every run), and the volatile state/turn lines come
+    last so a new turn only invalidates the tail of the cached prefix.
+    Pass constraints_json to reuse an already serialized constraints block.
+    """
+    if constraints_json is None:
+        constraints_json = _constraints_block(belief_context.get("global_constraints"))
+    
+    return f"""You are a specialized {specialty} agent working on project {belief_context.get('project_id')}.
+
+CRITICAL CONSTRAINTS (Project DNA):
+{constraints_json}
+
+You MUST adhere to these constraints in ALL outputs. Any deviation will result in task failure.
+
+Work efficiently and maintain alignment with project constraints.
+If uncertain, state assumptions clearly.
+
+Current project state: {belief_context.get('state')}
+Turn: {belief_context.get('turn')}
+"""
+
+
 class KimiInternAgent:
     """
     Real Kimi K2.5 powered intern agent
     Integrates with EROS monitoring and PAD telemetry
     """
     
+    OUTPUT_HISTORY = 4096  # Chunks retained; PAD only reads the last few
+    YIELD_EVERY = 32  # Chunks between explicit yields to the event loop
+    CONNECT_ATTEMPTS = 3  # Tries per request when the connection cannot be made
+    RESPONSE_CACHE_SIZE = 512  # Completions kept in a shared response cache
+    
     def __init__(self, 
                  agent_id: str,
                  specialty: str,
                  manager_id: str,
-                 kimi_config: KimiConfig):
+                 kimi_config: KimiConfig,
+                 session_provider: Optional[Callable[[], Awaitable[aiohttp.ClientSession]]] = None,
+                 prompt_renderer: Optional[Callable[[str, Mapping], str]] = None,
+                 response_cache: Optional[Dict[bytes, str]] = None):
         self.agent_id = agent_id
         self.specialty = specialty
         self.manager_id = manager_id
         self.config = kimi_config
         
         # EROS monitoring integration
-        self.output_buffer = []
+        # Output history as parallel columns (delta None marks the terminal
+        # entry); dicts are only built when telemetry reads them. Oldest evicted
+        self._ts_buf = deque(maxlen=self.OUTPUT_HISTORY)
+        self._content_buf = deque(maxlen=self.OUTPUT_HISTORY)
+        self._delta_buf = deque(maxlen=self.OUTPUT_HISTORY)
+        self.chunks_emitted = 0  # Lifetime count; tells the monitor if anything is new
         self.state = "idle"
         self.task = None
+        self.goal_keywords: frozenset = frozenset()  # Cached per task for PAD
         self.start_time = None
         
-        # Session management
+        # Session management - shared through the manager's provider when
+        # given, so interns reuse one keepalive pool instead of handshaking each
         self.session: Optional[aiohttp.ClientSession] = None
+        self._session_provider = session_provider
+        self._owns_session = session_provider is None
+        self._prompt_renderer = prompt_renderer
+        self._response_cache = response_cache  # Only consulted at temperature 0
+        
+        # Kill support: stop reading and drop the in-flight response only
+        self._current_response: Optional[aiohttp.ClientResponse] = None
+        self._task_cancel_event = asyncio.Event()
         
     async def _ensure_session(self):
         """Ensure aiohttp session is active"""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(
-                headers={
-                    "Authorization": f"Bearer {self.config.api_key}",
-                    "Content-Type": "application/json"
-                },
-                timeout=aiohttp.ClientTimeout(total=self.config.timeout)
-            )
+        if self._session_provider is not None:
+            self.session = await self._session_provider()
+        elif self.session is None or self.session.closed:
+            self.session = self.config.new_session()
     
     async def execute_task(self, task: Dict, belief_context: Dict) -> Dict:
         """
@@ -69,11 +189,13 @@ class KimiInternAgent:
             belief_context: Shared belief registry state
             
         Returns:
-            Task result with streaming outputs for PAD monitoring
+            Task result; the completion (possibly partial) is in "text"
         """
         self.task = task
+        self.goal_keywords = goal_keywords_for(task.get("goal", ""))
         self.state = "running"
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+        self._task_cancel_event.clear()
         
         await self._ensure_session()
         
@@ -83,32 +205,54 @@ class KimiInternAgent:
         # Build user prompt from task
         user_prompt = self._build_user_prompt(task)
         
+        # Deterministic completions can be reused for identical prompts
+        cache_key = self._response_cache_key(system_prompt, user_prompt)
+        cached = self._response_cache.get(cache_key) if cache_key else None
+        
         result = {
             "agent_id": self.agent_id,
             "task_id": task.get("id"),
-            "outputs": [],
             "status": "in_progress",
             "belief_context_turn": belief_context.get("turn")
         }
         
+        # Chunks accumulate into one string; PAD reads the column buffers
+        text = io.StringIO()
+        since_yield = 0
+        loop = asyncio.get_running_loop()  # loop.time() is the same monotonic clock
+        start = self.start_time
+        
         try:
             # Call Kimi API with streaming for real-time monitoring
-            async for chunk in self._stream_completion(system_prompt, user_prompt):
+            if cached is not None:
+                result["cached"] = True
+                chunks = self._replay(cached)
+            else:
+                chunks = self._stream_completion(system_prompt, user_prompt)
+            
+            async for chunk in chunks:
                 # Store in output buffer for PAD analysis
-                self.output_buffer.append({
-                    "timestamp": time.time(),
-                    "content": chunk,
-                    "delta": time.time() - self.start_time
-                })
+                now = loop.time()
+                self._ts_buf.append(now)
+                self._content_buf.append(chunk)
+                self._delta_buf.append(now - start)
+                self.chunks_emitted += 1
                 
-                result["outputs"].append(chunk)
+                text.write(chunk)
                 
-                # Yield control to allow manager monitoring
-                await asyncio.sleep(0)
+                # Yield control to allow manager monitoring; socket reads
+                # already yield, so only force it every YIELD_EVERY chunks
+                since_yield += 1
+                if since_yield >= self.YIELD_EVERY:
+                    since_yield = 0
+                    await asyncio.sleep(0)
             
-            result["status"] = "completed"
-            result["duration"] = time.time() - self.start_time
-            self.state = "completed"
+            if self._task_cancel_event.is_set():
+                result["status"] = "killed"
+            else:
+                result["status"] = "completed"
+                result["duration"] = time.monotonic() - self.start_time
+                self.state = "completed"
             
         except asyncio.TimeoutError:
             result["status"] = "timeout"
@@ -116,57 +260,71 @@ class KimiInternAgent:
             self.state = "failed"
             
         except Exception as e:
-            result["status"] = "error"
-            result["error"] = str(e)
-            self.state = "failed"
+            if self._task_cancel_event.is_set():
+                # Reading a response released by kill() may raise; state stays killed
+                result["status"] = "killed"
+            else:
+                result["status"] = "error"
+                result["error"] = str(e)
+                self.state = "failed"
+        
+        result["text"] = text.getvalue()
+        if result["status"] == "completed" and cache_key and cached is None:
+            self._store_response(cache_key, result["text"])
         
         return result
     
-    def _build_system_prompt(self, belief_context: Dict) -> str:
+    def _build_system_prompt(self, belief_context: Mapping) -> str:
         """
         Build system prompt that embeds belief registry constraints
         
-        This ensures agent operates within project DNA
+        This ensures agent operates within project DNA; the manager's
+        renderer shares one rendered prompt across interns of a specialty
         """
-        constraints = belief_context.get("global_constraints", {})
-        
-        system_prompt = f"""You are a specialized {self.specialty} agent working on project {belief_context.get('project_id')}.
-
-CRITICAL CONSTRAINTS (Project DNA):
-{json.dumps(constraints, indent=2)}
-
-You MUST adhere to these constraints in ALL outputs. Any deviation will result in task failure.
-
-Current project state: {belief_context.get('state')}
-Turn: {belief_context.get('turn')}
-
-Work efficiently and maintain alignment with project constraints.
-If uncertain, state assumptions clearly.
-"""
-        return system_prompt
+        if self._prompt_renderer is not None:
+            return self._prompt_renderer(self.specialty, belief_context)
+        return render_system_prompt(self.specialty, belief_context)
     
     def _build_user_prompt(self, task: Dict) -> str:
         """Build user prompt from task specification"""
-        goal = task.get("goal", "")
         context = task.get("context", "")
         constraints = task.get("constraints", [])
+        correction = task.get("context_correction")
         
-        prompt_parts = [f"Task: {goal}"]
+        parts = ["Task: ", str(task.get("goal", ""))]
         
         if context:
-            prompt_parts.append(f"\nContext: {context}")
+            parts += ("\n\nContext: ", str(context))
         
         if constraints:
-            prompt_parts.append("\nAdditional Constraints:")
-            for c in constraints:
-                prompt_parts.append(f"- {c}")
+            parts += ("\n\nAdditional Constraints:", "\n- ".join(("",) + tuple(map(str, constraints))))
         
         # Add correction context if this is a respawn
-        if task.get("context_correction"):
-            prompt_parts.append(f"\n⚠️ CORRECTION FROM PREVIOUS ATTEMPT:")
-            prompt_parts.append(task["context_correction"])
+        if correction:
+            parts += ("\n\n⚠️ CORRECTION FROM PREVIOUS ATTEMPT:\n", correction)
         
-        return "\n".join(prompt_parts)
+        return "".join(parts)
+    
+    def _response_cache_key(self, system_prompt: str, user_prompt: str) -> Optional[bytes]:
+        """Cache key for a prompt pair, or None when responses aren't cacheable"""
+        if self._response_cache is None or self.config.temperature != 0.0:
+            return None
+        return hashlib.blake2b(
+            b"\x00".join((system_prompt.encode(), user_prompt.encode())),
+            digest_size=16
+        ).digest()
+    
+    def _store_response(self, key: bytes, text: str):
+        """Remember a completion, evicting the oldest entry when full"""
+        cache = self._response_cache
+        if key not in cache and len(cache) >= self.RESPONSE_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = text
+    
+    @staticmethod
+    async def _replay(text: str) -> AsyncIterator[str]:
+        """Serve a cached completion as a single chunk"""
+        yield text
     
     async def _stream_completion(self, 
                                   system_prompt: str,
@@ -188,49 +346,98 @@ If uncertain, state assumptions clearly.
             "stream": True  # Enable streaming for monitoring
         }
         
-        async with self.session.post(url, json=payload) as response:
+        # Encoded once, so connection retries resend the same bytes
+        body = _json_bytes(payload)
+        
+        cancelled = self._task_cancel_event
+        
+        async with await self._post_with_retry(url, body) as response:
             response.raise_for_status()
+            self._current_response = response
             
-            async for line in response.content:
-                line = line.decode('utf-8').strip()
-                
-                if not line or line == "data: [DONE]":
-                    continue
+            try:
+                # Split complete lines out of raw blocks ourselves; only the
+                # "data: " payload is ever decoded, straight from bytes
+                buf = bytearray()
+                async for block in response.content.iter_chunked(8192):
+                    buf += block
+                    start = 0
+                    while (end := buf.find(b"\n", start)) >= 0:
+                        if cancelled.is_set():
+                            return
+                        content = self._parse_sse_line(buf[start:end])
+                        start = end + 1
+                        if content:
+                            yield content
+                    del buf[:start]
                 
-                if line.startswith("data: "):
-                    try:
-                        data = json.loads(line[6:])
-                        
-                        if "choices" in data and len(data["choices"]) > 0:
-                            delta = data["choices"][0].get("delta", {})
-                            content = delta.get("content", "")
-                            
-                            if content:
-                                yield content
-                    
-                    except json.JSONDecodeError:
-                        continue
+                content = self._parse_sse_line(buf)
+                if content and not cancelled.is_set():
+                    yield content
+            finally:
+                self._current_response = None
+    
+    async def _post_with_retry(self, url: str, body: bytes) -> aiohttp.ClientResponse:
+        """POST, backing off exponentially (100ms, 200ms) on connection failures"""
+        for attempt in range(self.CONNECT_ATTEMPTS):
+            try:
+                return await self.session.post(url, data=body)
+            except aiohttp.ClientConnectorError:
+                if attempt == self.CONNECT_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(0.1 * 2 ** attempt)
+    
+    @staticmethod
+    def _parse_sse_line(line: bytes) -> Optional[str]:
+        """Extract the delta content from one SSE line, if any"""
+        line = line.strip()
+        if not line.startswith(b"data: ") or line == b"data: [DONE]":
+            return None
+        
+        try:
+            data = _json_loads(line[6:])
+        except ValueError:  # JSONDecodeError or invalid UTF-8
+            return None
+        
+        if "choices" in data and len(data["choices"]) > 0:
+            return data["choices"][0].get("delta", {}).get("content")
+        return None
     
     def get_recent_output(self, n: int = 10) -> List[Dict]:
-        """Get recent outputs for PAD telemetry"""
-        return self.output_buffer[-n:]
+        """
+        Get recent outputs for PAD telemetry
+        Entry timestamps are loop.time() (monotonic), for spacing between chunks
+        """
+        # Walk back from the newest entry so only n items are touched
+        recent = [
+            {"timestamp": ts, "content": content, "delta": delta}
+            if delta is not None else
+            {"timestamp": ts, "content": content, "terminal": True}
+            for ts, content, delta in islice(
+                zip(reversed(self._ts_buf), reversed(self._content_buf), reversed(self._delta_buf)),
+                n
+            )
+        ]
+        recent.reverse()
+        return recent
     
     def kill(self, reason: str):
         """Manager-issued SIG_KILL"""
         self.state = "killed"
-        self.output_buffer.append({
-            "timestamp": time.time(),
-            "content": f"TERMINATED: {reason}",
-            "terminal": True
-        })
-        
-        # Cancel any ongoing API requests
-        if self.session and not self.session.closed:
-            asyncio.create_task(self.session.close())
+        self._ts_buf.append(time.monotonic())  # Same clock as loop.time() for chunks
+        self._content_buf.append(f"TERMINATED: {reason}")
+        self._delta_buf.append(None)
+        self.chunks_emitted += 1
+        
+        # Stop the stream and drop just this request's connection; the
+        # session (and its pool) stays up for the other interns
+        self._task_cancel_event.set()
+        if self._current_response is not None:
+            self._current_response.release()
     
     async def cleanup(self):
         """Cleanup resources"""
-        if self.session and not self.session.closed:
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
 
 
@@ -240,107 +447,348 @@ class KimiEROSManager:
     Inherits monitoring logic, uses real API agents
     """
     
-    def __init__(self, manager_id: str, belief_registry, kimi_config: KimiConfig):
+    # Keyed by (pleasure < 0.2, arousal > 0.8, dominance < 0.3)
+    _DIAGNOSES = diagnosis_table(
+        "Low goal alignment - task divergence detected",
+        "High arousal - agent stalling or infinite retry",
+        "Low dominance - excessive uncertainty"
+    )
+    
+    def __init__(self,
+                 manager_id: str,
+                 belief_registry,
+                 kimi_config: KimiConfig,
+                 session: Optional[aiohttp.ClientSession] = None):
         self.manager_id = manager_id
         self.belief_registry = belief_registry
         self.kimi_config = kimi_config
         
+        # One session per manager; an externally supplied one is never closed here
+        self._session = session
+        self._owns_session = session is None
+        
         self.interns: List[KimiInternAgent] = []
         self.max_interns = 10
         self.monitoring_interval = 2.0  # Check every 2 seconds for real API
         self.status_log = []
+        
+        # Rendered system prompts for the current belief snapshot, by specialty.
+        # Snapshots from BeliefRegistry.sync() are immutable and republished on
+        # every transition, so identity is a sufficient cache key
+        self._system_prompt_cache: Dict[str, str] = {}
+        self._system_prompt_context: Optional[Mapping] = None
+        self._constraints_view: Optional[Mapping] = None
+        self._constraints_json = ""
+        
+        # Completions shared by interns for identical deterministic prompts
+        self._response_cache: Dict[bytes, str] = {}
+        
+        # PAD scoring runs off the event loop so streaming is never blocked;
+        # analysis is skipped for interns with no output since the last pass
+        self._pad_pool: Optional[ThreadPoolExecutor] = None  # See _get_pad_pool
+        self._last_analyzed: Dict[str, int] = {}
+        
+        # Registry writes scheduled by spawn_team; batches spawned with no
+        # running loop wait in _unregistered for the next spawn or flush
+        self._registration_tasks: set = set()
+        self._unregistered: List[Tuple[str, Dict]] = []
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Lazily create the manager's shared session"""
+        if self._session is None or self._session.closed:
+            self._session = self.kimi_config.new_session()
+            self._owns_session = True
+        return self._session
+    
+    def _get_pad_pool(self) -> ThreadPoolExecutor:
+        """Lazily create the PAD scoring pool (again after cleanup, like the session)"""
+        if self._pad_pool is None:
+            self._pad_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix=f"{self.manager_id}_pad")
+        return self._pad_pool
+    
+    def _render_system_prompt(self, specialty: str, belief_context: Mapping) -> str:
+        """Render a system prompt once per specialty per belief snapshot"""
+        if belief_context is not self._system_prompt_context:
+            self._system_prompt_cache.clear()  # Older snapshots are never asked for again
+            self._system_prompt_context = belief_context
+            
+            # The registry shares one constraints view across snapshots, so
+            # the serialized block survives turn changes
+            constraints = belief_context.get("global_constraints") or {}
+            if constraints is not self._constraints_view:
+                self._constraints_view = constraints
+                self._constraints_json = _constraints_block(constraints)
+        
+        prompt = self._system_prompt_cache.get(specialty)
+        if prompt is None:
+            prompt = self._system_prompt_cache[specialty] = render_system_prompt(
+                specialty, belief_context, self._constraints_json
+            )
+        return prompt
     
     def spawn_intern(self, specialty: str) -> KimiInternAgent:
         """Spawn Kimi-powered intern"""
-        if len(self.interns) >= self.max_interns:
+        return self.spawn_team([specialty])[0]
+    
+    def spawn_team(self, specialties: Sequence[str]) -> List[KimiInternAgent]:
+        """
+        Spawn several Kimi-powered interns at once
+        All of them are registered with a single belief registry write
+        """
+        if len(self.interns) + len(specialties) > self.max_interns:
             raise ValueError(f"Manager {self.manager_id} at capacity")
         
-        agent_id = f"{self.manager_id}_kimi_{len(self.interns)}"
-        
-        intern = KimiInternAgent(
-            agent_id=agent_id,
-            specialty=specialty,
-            manager_id=self.manager_id,
-            kimi_config=self.kimi_config
-        )
-        
-        self.interns.append(intern)
+        team = []
+        batch = []
+        for specialty in specialties:
+            agent_id = f"{self.manager_id}_kimi_{len(self.interns)}"
+            
+            intern = KimiInternAgent(
+                agent_id=agent_id,
+                specialty=specialty,
+                manager_id=self.manager_id,
+                kimi_config=self.kimi_config,
+                session_provider=self._get_session,
+                prompt_renderer=self._render_system_prompt,
+                response_cache=self._response_cache
+            )
+            
+            self.interns.append(intern)
+            team.append(intern)
+            batch.append((agent_id, {
+                "type": "kimi_intern",
+                "specialty": specialty,
+                "manager": self.manager_id,
+                "model": self.kimi_config.model
+            }))
+        
+        self._schedule_registration(batch)
+        return team
+    
+    def _schedule_registration(self, batch: List[Tuple[str, Dict]]):
+        """Queue one register_agents write for a batch (spawning stays synchronous)"""
+        self._unregistered.extend(batch)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Written on the next spawn or flush_registrations() under a loop
+        
+        batch, self._unregistered = self._unregistered, []
+        task = loop.create_task(self.belief_registry.register_agents(batch))
+        self._registration_tasks.add(task)
+        task.add_done_callback(self._registration_tasks.discard)
+    
+    async def flush_registrations(self):
+        """Wait until every spawned intern is in the belief registry"""
+        if self._unregistered:
+            batch, self._unregistered = self._unregistered, []
+            await self.belief_registry.register_agents(batch)
+        if self._registration_tasks:
+            await asyncio.gather(*self._registration_tasks)
+    
+    def _next_idle_intern(self, specialty: Optional[str] = None) -> KimiInternAgent:
+        """Pick an intern not currently running, preferring a matching specialty"""
+        idle = [i for i in self.interns if i.state != "running"]
+        if not idle:
+            raise RuntimeError(f"Manager {self.manager_id} has no idle interns")
+        for intern in idle:
+            if intern.specialty == specialty:
+                return intern
+        return idle[0]
+    
+    async def run_tasks(self, tasks: List[Dict], concurrency: int = 4) -> List[Dict]:
+        """
+        Run tasks through a bounded worker pool over the spawned interns
         
-        self.belief_registry.register_agent(agent_id, {
-            "type": "kimi_intern",
-            "specialty": specialty,
-            "manager": self.manager_id,
-            "model": self.kimi_config.model
-        })
+        Workers pull from a queue so at most `concurrency` requests are in
+        flight, instead of firing every task at the API at once.
+        Results are returned in task order.
+        """
+        if not self.interns:
+            raise ValueError(f"Manager {self.manager_id} has no interns to run tasks")
+        
+        # Each worker holds at most one intern, so an idle one is always free
+        concurrency = max(1, min(concurrency, len(self.interns)))
+        
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, task in enumerate(tasks):
+            queue.put_nowait((index, task))
+        
+        results: List[Optional[Dict]] = [None] * len(tasks)
+        
+        async def worker():
+            while True:
+                index, task = await queue.get()
+                intern = None
+                try:
+                    intern = self._next_idle_intern(task.get("specialty"))
+                    results[index] = await intern.execute_task(task, self.belief_registry.sync())
+                except Exception as e:
+                    # A failed task must not take its worker down with it,
+                    # or queue.join() would never return
+                    if intern is not None and intern.state == "running":
+                        intern.state = "failed"
+                    results[index] = {
+                        "agent_id": intern.agent_id if intern is not None else None,
+                        "task_id": task.get("id"),
+                        "status": "error",
+                        "error": str(e)
+                    }
+                finally:
+                    queue.task_done()
+        
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        try:
+            await queue.join()
+        finally:
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
         
-        return intern
+        return results
     
-    async def monitor_intern(self, intern: KimiInternAgent):
+    async def monitor_intern(self, intern: KimiInternAgent, now: Optional[float] = None):
         """
         Real-time monitoring with PAD telemetry
         Uses same logic as simulated version with timeout protection
+        Pass now (time.monotonic()) to share one clock read across a monitor pass;
+        it only drives the warm-up/timeout checks - alert timestamps are time.time()
         """
-        from eros_core import PADAnalyzer
-        
         if intern.state != "running":
             return None
         
-        # CRITICAL FIX: Prevent zombie monitoring - timeout stalled agents
-        if intern.start_time and time.time() - intern.start_time > 600:  # 10 min max
+        if now is None:
+            now = time.monotonic()
+        
+        alert = self._timeout_alert(intern, now)
+        if alert:
+            return alert
+        
+        recent_outputs = self._pad_window(intern, now)
+        if recent_outputs is None:
+            return None
+        
+        # Compute PAD in the worker pool
+        pad = await asyncio.get_running_loop().run_in_executor(
+            self._get_pad_pool(),
+            PADAnalyzer.analyze_output,
+            recent_outputs,
+            intern.task.get("goal", ""),
+            intern.goal_keywords
+        )
+        
+        return self._pad_alert(intern, pad)
+    
+    async def monitor_all(self, interns: Optional[Sequence[KimiInternAgent]] = None) -> List[Optional[Dict]]:
+        """
+        Monitor many interns in one pass
+        One clock read and one batched PAD scan in the worker pool for every
+        due intern; results line up with interns (None where all is well)
+        """
+        if interns is None:
+            interns = self.interns
+        now = time.monotonic()
+        
+        alerts: Dict[str, Optional[Dict]] = {}
+        due: List[KimiInternAgent] = []
+        windows: List[List[Dict]] = []
+        for intern in interns:
+            if intern.state != "running":
+                continue
+            alert = self._timeout_alert(intern, now)
+            if alert:
+                alerts[intern.agent_id] = alert
+                continue
+            window = self._pad_window(intern, now)
+            if window is not None:
+                due.append(intern)
+                windows.append(window)
+        
+        if due:
+            pads = await asyncio.get_running_loop().run_in_executor(
+                self._get_pad_pool(),
+                self._analyze_windows,
+                windows,
+                [intern.goal_keywords for intern in due]
+            )
+            for intern, pad in zip(due, pads):
+                alerts[intern.agent_id] = self._pad_alert(intern, pad)
+        
+        return [alerts.get(intern.agent_id) for intern in interns]
+    
+    @staticmethod
+    def _analyze_windows(windows: List[List[Dict]], goal_keywords: List[frozenset]) -> List[PADTelemetry]:
+        """Score every window with a single PADAnalyzer.analyze_batch call"""
+        texts = [[o.get("content", "") for o in window] for window in windows]
+        return PADAnalyzer.analyze_batch(
+            [" ".join(t).lower() for t in texts],
+            texts,
+            goal_keywords
+        )
+    
+    def _timeout_alert(self, intern: KimiInternAgent, now: float) -> Optional[Dict]:
+        """CRITICAL FIX: Prevent zombie monitoring - timeout stalled agents"""
+        if intern.start_time and now - intern.start_time > 600:  # 10 min max
             return {
                 "manager_id": self.manager_id,
                 "intern_id": intern.agent_id,
                 "alert": "TIMEOUT",
                 "telemetry": {"pleasure": 0.0, "arousal": 1.0, "dominance": 0.0},
                 "reason": "Agent exceeded 10-minute execution timeout",
-                "timestamp": time.time()
+                "timestamp": time.time()  # Wall clock, like status_log entries
             }
-        
+        return None
+    
+    def _pad_window(self, intern: KimiInternAgent, now: float) -> Optional[List[Dict]]:
+        """Recent outputs to score on this pass, or None if the intern is not due"""
         # Allow warm-up period
-        if intern.start_time and time.time() - intern.start_time < 30:
+        if intern.start_time and now - intern.start_time < 30:
+            return None
+        
+        # Nothing new since the last pass - the previous verdict still stands
+        emitted = intern.chunks_emitted
+        if self._last_analyzed.get(intern.agent_id) == emitted:
             return None
         
         recent_outputs = intern.get_recent_output(n=5)
         if not recent_outputs or not intern.task:
             return None
         
-        # Compute PAD
-        pad = PADAnalyzer.analyze_output(
-            recent_outputs,
-            intern.task.get("goal", "")
-        )
-        
+        self._last_analyzed[intern.agent_id] = emitted
+        return recent_outputs
+    
+    def _pad_alert(self, intern: KimiInternAgent, pad: PADTelemetry) -> Optional[Dict]:
+        """Build an alert if the PAD vector is unhealthy"""
         # Health check
         if not pad.is_healthy():
             return {
                 "manager_id": self.manager_id,
                 "intern_id": intern.agent_id,
                 "alert": "INTERVENTION_REQUIRED",
-                "telemetry": {
-                    "pleasure": pad.pleasure,
-                    "arousal": pad.arousal,
-                    "dominance": pad.dominance
-                },
+                "telemetry": pad.to_dict(),
                 "reason": self._diagnose_failure(pad),
-                "timestamp": time.time()
+                "timestamp": time.time()  # Wall clock, like status_log entries
             }
         
         return None
     
-    def _diagnose_failure(self, pad) -> str:
+    def _diagnose_failure(self, pad: PADTelemetry) -> str:
         """Same diagnosis logic as core"""
-        if pad.pleasure < 0.2:
-            return "Low goal alignment - task divergence detected"
-        if pad.arousal > 0.8:
-            return "High arousal - agent stalling or infinite retry"
-        if pad.dominance < 0.3:
-            return "Low dominance - excessive uncertainty"
-        return "Unknown failure mode"
+        return self._DIAGNOSES[(pad.pleasure < 0.2, pad.arousal > 0.8, pad.dominance < 0.3)]
     
     async def cleanup(self):
-        """Cleanup all intern sessions"""
+        """Cleanup all intern sessions, then the shared one"""
+        await self.flush_registrations()
+        
         cleanup_tasks = [intern.cleanup() for intern in self.interns]
         await asyncio.gather(*cleanup_tasks, return_exceptions=True)
+        
+        if self._owns_session and self._session and not self._session.closed:
+            await self._session.close()
+        
+        if self._pad_pool is not None:
+            self._pad_pool.shutdown(wait=False)
+            self._pad_pool = None
 
 
 # Example usage script
@@ -376,44 +824,38 @@ async def demo_kimi_integration():
     )
     
     # Spawn Kimi agents
-    code_agent = manager.spawn_intern("python_coding")
-    doc_agent = manager.spawn_intern("documentation")
-    
-    # Execute tasks
-    belief_context = orchestrator.belief_registry.sync()
-    
-    tasks = [
-        code_agent.execute_task(
-            {
-                "id": "task_1",
-                "goal": "Write a Python function to calculate Fibonacci numbers",
-                "constraints": ["Use recursion", "Add docstring"]
-            },
-            belief_context
-        ),
-        doc_agent.execute_task(
-            {
-                "id": "task_2", 
-                "goal": "Write markdown documentation for Fibonacci function",
-                "context": "Explain time complexity"
-            },
-            belief_context
-        )
-    ]
+    manager.spawn_team(["python_coding", "documentation"])
+    
+    # Execute tasks through the manager's bounded worker pool
+    run = asyncio.create_task(manager.run_tasks([
+        {
+            "id": "task_1",
+            "specialty": "python_coding",
+            "goal": "Write a Python function to calculate Fibonacci numbers",
+            "constraints": ["Use recursion", "Add docstring"]
+        },
+        {
+            "id": "task_2",
+            "specialty": "documentation",
+            "goal": "Write markdown documentation for Fibonacci function",
+            "context": "Explain time complexity"
+        }
+    ]))
     
     # Monitor in parallel
     async def monitor_loop():
-        while any(i.state == "running" for i in manager.interns):
+        while not run.done():
             await asyncio.sleep(manager.monitoring_interval)
             
-            for intern in manager.interns:
-                alert = await manager.monitor_intern(intern)
+            alerts = await manager.monitor_all()
+            for intern, alert in zip(manager.interns, alerts):
                 if alert:
                     print(f"⚠️ Alert: {alert['reason']}")
                     intern.kill(alert['reason'])
     
     # Execute
-    results = await asyncio.gather(*tasks, monitor_loop())
+    await monitor_loop()
+    results = await run
     
     # Cleanup
     await manager.cleanup()
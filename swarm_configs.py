@@ -3,14 +3,57 @@ EROS Configuration Template
 Customize this file for your specific swarm use case
 """
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping, Optional, Sequence
 
 
-@dataclass
+# Default project constraints - CUSTOMIZE THIS
+# Built once at import; configs that don't override them share these views
+DEFAULT_CONSTRAINTS: Mapping = MappingProxyType({
+    # Code Quality
+    "coding_standard": "PEP8",
+    "documentation_required": True,
+    "test_coverage_min": 80,
+    
+    # Technology Stack
+    "backend_language": "Python",
+    "frontend_framework": "React",
+    "database": "PostgreSQL",
+    
+    # Style Guide
+    "ui_theme": "modern_minimal",
+    "color_scheme": "blue_gray",
+})
+
+# Default team structure - CUSTOMIZE THIS
+DEFAULT_TEAMS: Sequence[Mapping] = tuple(MappingProxyType(team) for team in [
+    {
+        "name": "Backend Team",
+        "manager_id": "backend_mgr",
+        "specialties": ("api_developer", "auth_specialist", "database_specialist"),
+        "max_agents": 10
+    },
+    {
+        "name": "Frontend Team", 
+        "manager_id": "frontend_mgr",
+        "specialties": ("component_developer", "page_developer", "ui_specialist"),
+        "max_agents": 8
+    },
+    {
+        "name": "QA Team",
+        "manager_id": "qa_mgr", 
+        "specialties": ("test_engineer", "security_auditor", "performance_tester"),
+        "max_agents": 5
+    }
+])
+
+
+@dataclass(frozen=True, slots=True)
 class SwarmConfig:
     """
     Main configuration for your EROS swarm
+    Frozen: constraints and teams are stored as read-only views
     """
     
     # PROJECT IDENTITY
@@ -19,11 +62,13 @@ class SwarmConfig:
     
     # GLOBAL CONSTRAINTS (The Project DNA)
     # These are enforced across ALL agents via the Belief Registry
-    global_constraints: Dict = None
+    # Read-only views aren't hashable: hash on the scalar fields instead
+    # (equality still compares contents, so equal configs hash equally)
+    global_constraints: Mapping = field(default=None, hash=False)
     
     # TEAM STRUCTURE
     # Define how many managers and what they specialize in
-    teams: List[Dict] = None
+    teams: Sequence[Mapping] = field(default=None, hash=False)
     
     # MONITORING CONFIGURATION
     monitoring_interval_seconds: float = 2.0  # How often managers check interns
@@ -46,53 +91,28 @@ class SwarmConfig:
     kimi_max_tokens: int = 4096
     
     def __post_init__(self):
-        # Set defaults if not provided
+        # Set defaults if not provided (shared read-only, never rebuilt)
         if self.global_constraints is None:
-            self.global_constraints = self._default_constraints()
+            constraints = DEFAULT_CONSTRAINTS
+        else:
+            constraints = MappingProxyType(dict(self.global_constraints))
         
         if self.teams is None:
-            self.teams = self._default_teams()
-    
-    def _default_constraints(self) -> Dict:
-        """Default project constraints - CUSTOMIZE THIS"""
-        return {
-            # Code Quality
-            "coding_standard": "PEP8",
-            "documentation_required": True,
-            "test_coverage_min": 80,
-            
-            # Technology Stack
-            "backend_language": "Python",
-            "frontend_framework": "React",
-            "database": "PostgreSQL",
-            
-            # Style Guide
-            "ui_theme": "modern_minimal",
-            "color_scheme": "blue_gray",
-        }
+            teams = DEFAULT_TEAMS
+        else:
+            teams = tuple(self._freeze_team(team) for team in self.teams)
+        
+        # Frozen dataclass: normalized fields are written once, here
+        object.__setattr__(self, "global_constraints", constraints)
+        object.__setattr__(self, "teams", teams)
     
-    def _default_teams(self) -> List[Dict]:
-        """Default team structure - CUSTOMIZE THIS"""
-        return [
-            {
-                "name": "Backend Team",
-                "manager_id": "backend_mgr",
-                "specialties": ["api_developer", "auth_specialist", "database_specialist"],
-                "max_agents": 10
-            },
-            {
-                "name": "Frontend Team", 
-                "manager_id": "frontend_mgr",
-                "specialties": ["component_developer", "page_developer", "ui_specialist"],
-                "max_agents": 8
-            },
-            {
-                "name": "QA Team",
-                "manager_id": "qa_mgr", 
-                "specialties": ["test_engineer", "security_auditor", "performance_tester"],
-                "max_agents": 5
-            }
-        ]
+    @staticmethod
+    def _freeze_team(team: Mapping) -> Mapping:
+        """Read-only team view with specialties as a tuple, like DEFAULT_TEAMS"""
+        team = dict(team)
+        if "specialties" in team:
+            team["specialties"] = tuple(team["specialties"])
+        return MappingProxyType(team)
 
 
 # ============================================================================
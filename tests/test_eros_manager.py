@@ -0,0 +1,156 @@
+"""
+Regression tests for EROSManager, the belief registry and swarm health
+"""
+
+import asyncio
+import time
+import unittest
+
+from eros_core import AgentState, BeliefRegistry, EROSManager, SovereignOrchestrator
+
+
+class TestMonitorLoop(unittest.TestCase):
+
+    def test_monitor_loop_waits_for_queued_launches(self):
+        async def scenario():
+            manager = EROSManager("mgr", BeliefRegistry("P", {}))
+            interns = manager.spawn_interns_bulk(["a", "b", "c"])
+            pairs = [(intern, {"goal": "g"}) for intern in interns]
+
+            states = []
+
+            async def monitor():
+                await manager.monitor_loop()
+                states.extend(intern.state for intern in interns)
+
+            await asyncio.gather(manager.launch(pairs, max_concurrency=1), monitor())
+            return states
+
+        states = asyncio.run(scenario())
+
+        self.assertEqual(states, [AgentState.COMPLETED] * 3)
+
+    def test_silent_intern_is_swept_while_teammate_emits(self):
+        async def scenario():
+            manager = EROSManager("mgr", BeliefRegistry("P", {}))
+            manager.monitoring_interval = 0.2
+            busy, silent = manager.spawn_interns_bulk(["a", "b"])
+
+            for intern in (busy, silent):
+                intern.task = {"goal": "build api"}
+                intern.state = AgentState.RUNNING
+                intern.start_time = time.monotonic()
+            # Past warm-up and failing, but its output signal was already consumed
+            silent.start_time -= 60
+            silent._pulse_pending = True
+            for _ in range(3):
+                silent._emit_output("error: unable to connect, retrying")
+
+            async def chatter():
+                # Emits well inside every monitoring_interval for up to 2 s
+                caught_while_busy = False
+                for step in range(100):
+                    if silent.state != AgentState.RUNNING:
+                        caught_while_busy = True
+                        break
+                    busy._emit_output(f"step {step}")
+                    await asyncio.sleep(0.02)
+                busy.state = AgentState.COMPLETED
+                return caught_while_busy
+
+            monitor = asyncio.create_task(manager.monitor_loop())
+            caught_while_busy = await chatter()
+            return caught_while_busy, await asyncio.wait_for(monitor, timeout=5)
+
+        caught_while_busy, interventions = asyncio.run(scenario())
+
+        self.assertTrue(caught_while_busy)
+        self.assertEqual([log["intern_id"] for log in interventions], ["mgr_intern_1"])
+
+
+class TestLaunch(unittest.TestCase):
+
+    def test_missing_pending_task_raises_value_error(self):
+        manager = EROSManager("mgr", BeliefRegistry("P", {}))
+        ready, bare = manager.spawn_interns_bulk(["a", "b"])
+
+        with self.assertRaises(ValueError):
+            asyncio.run(manager.launch([(ready, {"goal": "g"}), (bare, None)]))
+        self.assertEqual(ready.state, AgentState.IDLE)
+
+    def test_failing_pair_cancels_its_siblings(self):
+        async def scenario():
+            manager = EROSManager("mgr", BeliefRegistry("P", {}))
+            first, broken, last = manager.spawn_interns_bulk(["a", "b", "c"])
+            pairs = [
+                (first, {"goal": "g", "estimated_steps": 50}),
+                (broken, {"goal": "g", "estimated_steps": "many"}),
+                (last, {"goal": "g", "estimated_steps": 50}),
+            ]
+            with self.assertRaises(TypeError):
+                await manager.launch(pairs, stagger=0.01)
+            # Nothing may still be running once launch has raised
+            await asyncio.sleep(0.3)
+            return [intern.state for intern in (first, broken, last)], manager.get_status_pulse()
+
+        states, pulse = asyncio.run(scenario())
+
+        self.assertEqual(states, [AgentState.KILLED, AgentState.FAILED, AgentState.IDLE])
+        self.assertEqual(pulse["interns_active"], 0)
+
+
+    def test_first_output_event_across_event_loops(self):
+        manager = EROSManager("mgr", BeliefRegistry("P", {}))
+        intern = manager.spawn_intern("a")
+
+        async def scenario():
+            job = asyncio.create_task(manager.launch([(intern, {"goal": "g", "estimated_steps": 2})]))
+            await asyncio.sleep(0.01)  # Let execute_task start and clear the previous event
+            await asyncio.wait_for(intern.first_output_event.wait(), timeout=5)
+            return await job
+
+        # QUICK_START pattern: the same intern reused in separate asyncio.run calls
+        for _ in range(2):
+            results = asyncio.run(scenario())
+            self.assertEqual(results[0]["status"], "completed")
+
+
+class TestSwarmHealth(unittest.TestCase):
+
+    def test_killed_intern_leaves_the_pad_matrix(self):
+        async def scenario():
+            orchestrator = SovereignOrchestrator("P", {})
+            manager = orchestrator.create_manager()
+            intern = manager.spawn_intern("a")
+            intern.task = {"goal": "build api"}
+            intern.state = AgentState.RUNNING
+            intern.start_time = time.monotonic() - 60
+            intern._emit_output("error: unable to connect, retrying")
+
+            alert = await manager.monitor_intern(intern)
+            before = orchestrator.swarm_health()
+            await manager.intervene(intern, alert["reason"])
+            await manager.respawn_with_correction(intern, "fix it")
+            return before, orchestrator.swarm_health()
+
+        before, after = asyncio.run(scenario())
+
+        self.assertEqual((before["sampled"], before["unhealthy"]), (1, 1))
+        self.assertEqual((after["sampled"], after["unhealthy"]), (0, 0))
+
+
+class TestBeliefRegistry(unittest.TestCase):
+
+    def test_to_dict_cannot_be_corrupted_by_callers(self):
+        registry = BeliefRegistry("P", {"lang": "python"})
+        view = registry.to_dict()
+
+        with self.assertRaises(TypeError):
+            view["turn"] = 99
+        with self.assertRaises(TypeError):
+            view["constraints"]["lang"] = "go"
+        self.assertEqual(registry.to_dict()["constraints"], {"lang": "python"})
+
+
+if __name__ == "__main__":
+    unittest.main()
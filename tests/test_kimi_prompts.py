@@ -0,0 +1,26 @@
+"""
+Tests for Kimi system prompt rendering
+"""
+
+import unittest
+
+from eros_core import BeliefRegistry
+from kimi_integration import render_system_prompt
+
+
+class TestConstraintsBlock(unittest.TestCase):
+
+    def test_mixed_keys_and_missing_constraints_render(self):
+        for constraints, block in [
+            ({1: "a", "b": 2}, '{\n  "1": "a",\n  "b": 2\n}'),
+            ({"nested": {2: "x", "k": "y"}}, '{\n  "nested": {\n    "2": "x",\n    "k": "y"\n  }\n}'),
+            (None, "{}"),
+            ({"big": 2 ** 70}, '{\n  "big": 1180591620717411303424\n}'),
+        ]:
+            with self.subTest(constraints=constraints):
+                prompt = render_system_prompt("code", BeliefRegistry("P", constraints).sync())
+                self.assertIn(f"(Project DNA):\n{block}\n", prompt)
+
+
+if __name__ == "__main__":
+    unittest.main()
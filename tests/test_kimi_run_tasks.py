@@ -0,0 +1,67 @@
+"""
+Regression tests for KimiEROSManager
+"""
+
+import asyncio
+import time
+import unittest
+
+from eros_core import BeliefRegistry
+from kimi_integration import KimiConfig, KimiEROSManager
+
+
+class TestRunTasks(unittest.TestCase):
+
+    def test_failing_task_does_not_stall_the_pool(self):
+        async def scenario():
+            config = KimiConfig(api_key="test", base_url="http://127.0.0.1:9/v1")
+            manager = KimiEROSManager("mgr", BeliefRegistry("P", {}), config)
+            manager.spawn_intern("generalist")
+            try:
+                # The first task breaks prompt building before any request is made
+                return await asyncio.wait_for(
+                    manager.run_tasks([
+                        {"id": "bad", "goal": "g", "context_correction": 5},
+                        {"id": "next", "goal": "h"}
+                    ]),
+                    timeout=10
+                )
+            finally:
+                await manager.cleanup()
+
+        results = asyncio.run(scenario())
+
+        self.assertEqual([r["task_id"] for r in results], ["bad", "next"])
+        self.assertEqual(results[0]["status"], "error")
+        self.assertIsNotNone(results[1])
+
+
+
+class TestCleanup(unittest.TestCase):
+
+    def test_monitoring_works_after_cleanup(self):
+        async def scenario():
+            manager = KimiEROSManager("mgr", BeliefRegistry("P", {}), KimiConfig(api_key="test"))
+            intern = manager.spawn_intern("generalist")
+            await manager.cleanup()
+
+            intern.state = "running"
+            intern.task = {"goal": "build api"}
+            intern.start_time = time.monotonic() - 60
+            # One streamed chunk, as execute_task records it
+            intern._ts_buf.append(time.monotonic())
+            intern._content_buf.append("error: unable to connect, retrying")
+            intern._delta_buf.append(0.0)
+            intern.chunks_emitted += 1
+            try:
+                return await manager.monitor_all()
+            finally:
+                await manager.cleanup()
+
+        alerts = asyncio.run(scenario())
+
+        self.assertEqual(alerts[0]["alert"], "INTERVENTION_REQUIRED")
+
+
+if __name__ == "__main__":
+    unittest.main()
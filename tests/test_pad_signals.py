@@ -0,0 +1,69 @@
+"""
+Parity tests: PAD signal matching against the original substring semantics
+"""
+
+import unittest
+
+from eros_core import (
+    CONFIDENT_SIGNALS, ERROR_SIGNALS, UNCERTAIN_SIGNALS,
+    PADAnalyzer, goal_keywords_for,
+)
+
+
+def reference_pad(texts, goal):
+    """The original PADAnalyzer.analyze_output: one `in` check per signal"""
+    combined = " ".join(texts).lower()
+    goal_keywords = set(goal.lower().split())
+    overlap = len(goal_keywords & set(combined.split()))
+    pleasure = min(1.0, overlap / max(len(goal_keywords), 1))
+
+    error_count = sum(1 for s in ERROR_SIGNALS if s in combined)
+    repetition = 0.4 if len(texts) >= 3 and len(set(texts[-3:])) < 3 else 0.0
+    arousal = min(1.0, error_count * 0.2 + repetition)
+
+    uncertain_count = sum(1 for s in UNCERTAIN_SIGNALS if s in combined)
+    confident_count = sum(1 for s in CONFIDENT_SIGNALS if s in combined)
+    dominance = max(0.0, min(1.0, (confident_count - uncertain_count * 0.5) / 5))
+    return (pleasure, arousal, dominance)
+
+
+WINDOWS = [
+    ["retrying again"],
+    ["Unable to connect, retrying again", "error: failed"],
+    ["maybe it might work", "not sure, still trying"],
+    ["uncertainty: trying again, maybe"],
+    ["Completed successfully", "done", "processed all rows"],
+    ["build api", "step 1", "step 1", "step 1"],
+    ["errorfailedretryunable", "mightmaybe"],
+    [""],
+]
+
+
+class TestSignalParity(unittest.TestCase):
+
+    def test_analyze_output_matches_substring_semantics(self):
+        for texts in WINDOWS:
+            with self.subTest(texts=texts):
+                pad = PADAnalyzer.analyze_output([{"content": t} for t in texts], "build api")
+                self.assertEqual(
+                    (pad.pleasure, pad.arousal, pad.dominance),
+                    reference_pad(texts, "build api")
+                )
+
+    def test_analyze_batch_matches_substring_semantics(self):
+        keywords = goal_keywords_for("build api")
+        pads = PADAnalyzer.analyze_batch(
+            [" ".join(texts).lower() for texts in WINDOWS],
+            WINDOWS,
+            [keywords] * len(WINDOWS)
+        )
+        for texts, pad in zip(WINDOWS, pads):
+            with self.subTest(texts=texts):
+                self.assertEqual(
+                    (pad.pleasure, pad.arousal, pad.dominance),
+                    reference_pad(texts, "build api")
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,22 @@
+"""
+Tests for the frozen SwarmConfig
+"""
+
+import unittest
+
+from swarm_configs import CODE_GEN_CONFIG, SwarmConfig
+
+
+class TestSwarmConfig(unittest.TestCase):
+
+    def test_configs_are_hashable(self):
+        self.assertEqual(hash(SwarmConfig()), hash(SwarmConfig()))
+        self.assertIn(CODE_GEN_CONFIG, {CODE_GEN_CONFIG})
+
+    def test_team_specialties_are_frozen(self):
+        config = SwarmConfig(teams=[{"name": "t", "specialties": ["api", "db"]}])
+        self.assertEqual(config.teams[0]["specialties"], ("api", "db"))
+
+
+if __name__ == "__main__":
+    unittest.main()